@@ -78,6 +78,7 @@ class Func(FunctionDecorator):
         *,
         default: bool = True,
         requires: Sequence[str] | None = None,
+        venv_key: Sequence[str] | None = None,
     ) -> None:
         self.func = func
         self.python = python
@@ -89,6 +90,7 @@ class Func(FunctionDecorator):
         self.tags = list(tags or [])
         self.default = default
         self.requires = list(requires or [])
+        self.venv_key = venv_key
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.func(*args, **kwargs)
@@ -107,6 +109,7 @@ class Func(FunctionDecorator):
             self.tags,
             default=self.default,
             requires=self._requires,
+            venv_key=self.venv_key,
         )
 
     @property
@@ -162,6 +165,7 @@ class Call(Func):
             func.tags + param_spec.tags,
             default=func.default,
             requires=func.requires,
+            venv_key=func.venv_key,
         )
         self.call_spec = call_spec
         self.session_signature = session_signature
@@ -58,6 +58,8 @@ av_bool = av.instance_of(bool)
 
 @attrs.define(slots=True, kw_only=True)
 class NoxOptions:
+    batch_install: bool = attrs.field(validator=av_bool)
+    cache_results: bool = attrs.field(validator=av_bool)
     default_venv_backend: None | str = attrs.field(validator=av_opt_str)
     envdir: None | str = attrs.field(validator=av_opt_str)
     error_on_external_run: bool = attrs.field(validator=av_bool)
@@ -458,6 +458,7 @@ options.add_options(
     _option_set.Option(
         "no_venv",
         "--no-venv",
+        "--use-current-env",
         group=options.groups["environment"],
         default=False,
         action="store_true",
@@ -588,6 +589,31 @@ options.add_options(
             " when a virtualenv is being reused."
         ),
     ),
+    _option_set.Option(
+        "batch_install",
+        "--batch-install",
+        default=False,
+        group=options.groups["execution"],
+        noxfile=True,
+        action="store_true",
+        help=(
+            "Collect consecutive session.install calls that only list requirements"
+            " into a single installer invocation."
+        ),
+    ),
+    _option_set.Option(
+        "cache_results",
+        "--cache-results",
+        default=False,
+        group=options.groups["execution"],
+        noxfile=True,
+        action="store_true",
+        help=(
+            "Skip sessions that already succeeded with the same session function,"
+            " parameters and Python. Only use this for sessions whose outcome does"
+            " not depend on anything else."
+        ),
+    ),
     _option_set.Option(
         "report",
         "--report",
@@ -639,6 +665,13 @@ options.add_options(
         hidden=True,
         default=os.getcwd,
     ),
+    # Stores the resolved directory of the Noxfile once it has been loaded, so
+    # that sessions don't need to resolve it again.
+    _option_set.Option(
+        "noxfile_dir",
+        group=None,
+        hidden=True,
+    ),
 )
 
 
@@ -50,6 +50,10 @@ def _parse_string_constant(node: ast.AST) -> str | None:  # pragma: no cover
 
 def _parse_needs_version(source: str, filename: str = "<unknown>") -> str | None:
     """Parse ``nox.needs_version`` from the user's Noxfile."""
+    # Most Noxfiles don't set it, so don't parse them just to find that out.
+    if "needs_version" not in source:
+        return None
+
     value: str | None = None
     module: ast.Module = ast.parse(source, filename=filename)
     for statement in module.body:
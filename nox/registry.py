@@ -56,6 +56,7 @@ def session_decorator(
     *,
     default: bool = ...,
     requires: Sequence[str] | None = ...,
+    venv_key: Sequence[str] | None = ...,
 ) -> Callable[[RawFunc | Func], Func]: ...
 
 
@@ -72,6 +73,7 @@ def session_decorator(
     *,
     default: bool = True,
     requires: Sequence[str] | None = None,
+    venv_key: Sequence[str] | None = None,
 ) -> Func | Callable[[RawFunc | Func], Func]:
     """Designate the decorated function as a session."""
     # If `func` is provided, then this is the decorator call with the function
@@ -93,6 +95,7 @@ def session_decorator(
             tags=tags,
             default=default,
             requires=requires,
+            venv_key=venv_key,
         )
 
     if py is not None and python is not None:
@@ -105,6 +108,10 @@ def session_decorator(
     if python is None:
         python = py
 
+    if isinstance(venv_key, str):
+        msg = "venv_key must be a list of requirements, not a single string."
+        raise TypeError(msg)
+
     final_name = name or func.__name__
 
     fn = Func(
@@ -117,6 +124,7 @@ def session_decorator(
         tags=tags,
         default=default,
         requires=requires,
+        venv_key=venv_key,
     )
     _REGISTRY[name or func.__name__] = fn
     return fn
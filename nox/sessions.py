@@ -16,20 +16,27 @@ from __future__ import annotations
 
 import contextlib
 import enum
-import hashlib
+import functools
+import inspect
+import json
+import marshal
 import os
 import pathlib
 import re
 import shutil
 import subprocess
 import sys
-import unicodedata
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     NoReturn,
+    Optional,
 )
 
+import packaging.requirements
+import packaging.utils
+
 import nox.command
 import nox.virtualenv
 from nox.logger import logger
@@ -80,21 +87,80 @@ def _chdir(path: str) -> Generator[None, None, None]:
         os.chdir(cwd)
 
 
+class _AsciiTable(Dict[int, Optional[int]]):
+    """A ``str.translate`` table that drops every non-ASCII code point.
+
+    Entries are filled in lazily, so a codepoint only costs a Python call the
+    first time it is seen.
+    """
+
+    def __missing__(self, key: int) -> int | None:
+        value = key if key < 128 else None
+        self[key] = value
+        return value
+
+
+_ASCII_TABLE = _AsciiTable()
+# Names that _normalize_name would return unchanged.
+_SAFE_NAME_RE = re.compile(r"[a-z0-9_]+(?:-[a-z0-9_]+)*")
+# Lowercases ASCII letters and maps every ASCII character that isn't a word
+# character to a dash.
+_SLUG_TABLE = {
+    c: chr(c).lower() if chr(c).isalnum() or chr(c) == "_" else "-" for c in range(128)
+}
+# Longest virtualenv path that leaves room for "bin/pythonX.Y" within 100
+# characters, and the longest envdir that still fits a hashed name.
+_MAX_VENV_PATH = 100 - len("bin/pythonX.Y")
+_MAX_ENVDIR = 100 - 9
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_name(path: str) -> str:
+    """Slugifies a session name into a single "safe" path component."""
+    if _SAFE_NAME_RE.fullmatch(path):
+        return path
+
+    # Decompose accented characters, then drop the combining marks (and any
+    # other non-ASCII characters) in a single translate pass. ASCII input is
+    # already in its final form.
+    if not path.isascii():
+        import unicodedata  # noqa: PLC0415
+
+        path = unicodedata.normalize("NFKD", path).translate(_ASCII_TABLE)
+    # Lowercase and turn anything else into dashes, then collapse and trim
+    # runs of them.
+    path = path.translate(_SLUG_TABLE)
+    return "-".join(filter(None, path.split("-")))
+
+
+def _short_hash(data: bytes, digest_size: int) -> str:
+    """Return the hex blake2b digest of ``data``, ``digest_size`` bytes long."""
+    import hashlib  # noqa: PLC0415
+
+    return hashlib.blake2b(data, digest_size=digest_size).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _requirement_name(requirement: str) -> str | None:
+    """Return the normalized project name of ``requirement``, or ``None`` if
+    it isn't a plain requirement string."""
+    try:
+        name = packaging.requirements.Requirement(requirement).name
+    except packaging.requirements.InvalidRequirement:
+        return None
+    return packaging.utils.canonicalize_name(name)
+
+
 def _normalize_path(envdir: str, path: str | bytes) -> str:
     """Normalizes a string to be a "safe" filesystem path for a virtualenv."""
     if isinstance(path, bytes):
         path = path.decode("utf-8")
-
-    path = unicodedata.normalize("NFKD", path).encode("ascii", "ignore")
-    path = path.decode("ascii")
-    path = re.sub(r"[^\w\s-]", "-", path).strip().lower()
-    path = re.sub(r"[-\s]+", "-", path)
-    path = path.strip("-")
+    path = _normalize_name(path)
 
     full_path = os.path.join(envdir, path)
-    if len(full_path) > 100 - len("bin/pythonX.Y"):
-        if len(envdir) < 100 - 9:
-            path = hashlib.sha1(path.encode("ascii")).hexdigest()[:8]  # noqa: S324
+    if len(full_path) > _MAX_VENV_PATH:
+        if len(envdir) < _MAX_ENVDIR:
+            path = _short_hash(path.encode("ascii"), digest_size=4)
             full_path = os.path.join(envdir, path)
             logger.warning("The virtualenv name was hashed to avoid being too long.")
         else:
@@ -133,6 +199,11 @@ def _dblquote_pkg_install_args(args: Iterable[str]) -> tuple[str, ...]:
     return tuple(_dblquote_pkg_install_arg(a) for a in args)
 
 
+# Environments created or validated by an earlier session in this process,
+# keyed by (location, backend, interpreter).
+_ENSURED_VENVS: set[tuple[str, str, Any]] = set()
+
+
 class _SessionQuit(Exception):
     pass
 
@@ -141,13 +212,25 @@ class _SessionSkip(Exception):
     pass
 
 
-class Status(enum.Enum):
+class Status(enum.IntEnum):
     ABORTED = -1
     FAILED = 0
     SUCCESS = 1
     SKIPPED = 2
 
 
+_STATUS_NAME_LOWER = {status: status.name.lower() for status in Status}
+
+# Name of the logger method used to report each status. Looked up by name so
+# that the logger can still be patched.
+_STATUS_LOG = {
+    Status.ABORTED: "error",
+    Status.FAILED: "error",
+    Status.SUCCESS: "success",
+    Status.SKIPPED: "warning",
+}
+
+
 class _WorkingDirContext:
     def __init__(self, dir: str | os.PathLike[str]) -> None:
         self._prev_working_dir = os.getcwd()
@@ -172,20 +255,29 @@ class Session:
     your Nox session.
     """
 
-    __slots__ = ("_runner",)
+    __slots__ = ("_bin", "_env", "_pending_context", "_pending_installs", "_runner")
 
     def __init__(self, runner: SessionRunner) -> None:
         self._runner = runner
+        self._pending_installs: list[str] = []
+        # The working directory and env the pending installs were requested
+        # with, so they are installed as if they had run right away.
+        self._pending_context: tuple[str, dict[str, str | None]] | None = None
+        # The runner's venv is created before the session and doesn't change
+        # afterwards, so its env dict and bin directory are looked up once on
+        # first use.
+        self._env: dict[str, str | None] | None = None
+        self._bin: str | None = None
 
     @property
-    def __dict__(self) -> dict[str, SessionRunner]:  # type: ignore[override]
+    def __dict__(self) -> dict[str, Any]:  # type: ignore[override]
         """Attribute dictionary for object inspection.
 
         This is needed because ``__slots__`` turns off ``__dict__`` by
         default. Unlike a typical object, modifying the result of this
         dictionary won't allow modification of the instance.
         """
-        return {"_runner": self._runner}
+        return {name: getattr(self, name) for name in Session.__slots__}
 
     @property
     def name(self) -> str:
@@ -195,7 +287,10 @@ class Session:
     @property
     def env(self) -> dict[str, str | None]:
         """A dictionary of environment variables to pass into all commands."""
-        return self.virtualenv.env
+        env = self._env
+        if env is None:
+            env = self._env = self.virtualenv.env
+        return env
 
     @property
     def posargs(self) -> list[str]:
@@ -232,11 +327,13 @@ class Session:
     @property
     def bin(self) -> str:
         """The first bin directory for the virtualenv."""
-        paths = self.bin_paths
-        if paths is None:
-            msg = "The environment does not have a bin directory."
-            raise ValueError(msg)
-        return paths[0]
+        if self._bin is None:
+            paths = self.bin_paths
+            if paths is None:
+                msg = "The environment does not have a bin directory."
+                raise ValueError(msg)
+            self._bin = paths[0]
+        return self._bin
 
     def create_tmp(self) -> str:
         """Create, and return, a temporary directory."""
@@ -318,7 +415,8 @@ class Session:
             session.run("flake8")
 
         """
-        self.log(f"cd {dir}")
+        self.flush_installs()
+        self.log("cd %s", dir)
         return _WorkingDirContext(dir)
 
     cd = chdir
@@ -326,11 +424,11 @@ class Session:
 
     def _run_func(self, func: Callable[..., Any], args: Iterable[Any]) -> Any:
         """Legacy support for running a function through :func`run`."""
-        self.log(f"{func}(args={args!r})")
+        self.log("%s(args=%r)", func, args)
         try:
             return func(*args)
         except Exception as e:
-            logger.exception(f"Function {func!r} raised {e!r}.")
+            logger.exception("Function %r raised %r.", func, e)
             raise nox.command.CommandFailed() from e
 
     def run(
@@ -456,7 +554,7 @@ class Session:
             raise ValueError(msg)
 
         if self._runner.global_config.install_only:
-            logger.info(f"Skipping {args[0]} run, as --install-only is set.")
+            logger.info("Skipping %s run, as --install-only is set.", args[0])
             return None
 
         return self._run(
@@ -604,13 +702,19 @@ class Session:
         terminate_timeout: float | None,
     ) -> Any:
         """Like run(), except that it runs even if --install-only is provided."""
+        # Anything deferred by --batch-install must be in place before running.
+        self.flush_installs()
+
         # Legacy support - run a function given.
         if callable(args[0]):
             return self._run_func(args[0], args[1:])  # type: ignore[unreachable]
 
+        venv = self.virtualenv
+        global_config = self._runner.global_config
+
         # Using `"uv"` when `uv` is the backend is guaranteed to work, even if it was co-installed with nox.
         if (
-            self.virtualenv.venv_backend == "uv"
+            venv.venv_backend == "uv"
             and args[0] == "uv"
             and nox.virtualenv.UV != "uv"
             and shutil.which("uv", path=self.bin) is None  # Session uv takes priority
@@ -618,17 +722,14 @@ class Session:
             args = (nox.virtualenv.UV, *args[1:])
 
         # Combine the env argument with our virtualenv's env vars.
-        env = self.virtualenv._get_env(env or {}, include_outer_env=include_outer_env)
+        env = venv._get_env(env or {}, include_outer_env=include_outer_env)
 
         # If --error-on-external-run is specified, error on external programs.
-        if self._runner.global_config.error_on_external_run and external is None:
+        if global_config.error_on_external_run and external is None:
             external = "error"
 
         # Allow all external programs when running outside a sandbox.
-        if (
-            not self.virtualenv.is_sandboxed
-            or args[0] in self.virtualenv.allowed_globals
-        ):
+        if not venv.is_sandboxed or args[0] in venv.allowed_globals:
             external = True
 
         if external is None:
@@ -638,7 +739,7 @@ class Session:
         return nox.command.run(
             args,
             env=env,
-            paths=self.bin_paths,
+            paths=venv.bin_paths,
             silent=silent,
             success_codes=success_codes,
             log=log,
@@ -833,15 +934,42 @@ class Session:
         if self._runner.global_config.no_install and venv._reused:
             return
 
+        if (
+            self._runner.global_config.batch_install
+            and env is None
+            and include_outer_env
+            and silent is None
+            and success_codes is None
+            and log
+            and stdout is None
+            and stderr == subprocess.STDOUT
+            and interrupt_timeout == DEFAULT_INTERRUPT_TIMEOUT
+            and terminate_timeout == DEFAULT_TERMINATE_TIMEOUT
+            and not any(
+                arg.startswith(("-", ".")) or "/" in arg or os.sep in arg
+                for arg in args
+            )
+            and all(_requirement_name(arg) for arg in args)
+        ):
+            # Plain requirements can share a single installer invocation;
+            # options are left alone since they would apply to every package,
+            # and paths are left alone since they depend on the directory. A
+            # project that is already pending is installed separately so the
+            # later requirement still overrides the earlier one.
+            context = (os.getcwd(), dict(self.env))
+            names = {_requirement_name(arg) for arg in args}
+            pending = {_requirement_name(arg) for arg in self._pending_installs}
+            if context != self._pending_context or names & pending:
+                self.flush_installs()
+            self._pending_context = context
+            self._pending_installs.extend(args)
+            return
+
         if silent is None:
             silent = True
 
-        if isinstance(venv, VirtualEnv) and venv.venv_backend == "uv":
-            cmd = ["uv", "pip", "install"]
-        else:
-            cmd = ["python", "-m", "pip", "install"]
         self._run(
-            *cmd,
+            *self._install_cmd(),
             *args,
             env=env,
             include_outer_env=include_outer_env,
@@ -855,6 +983,44 @@ class Session:
             terminate_timeout=terminate_timeout,
         )
 
+    def _install_cmd(self) -> list[str]:
+        venv = self._runner.venv
+        if isinstance(venv, VirtualEnv) and venv.venv_backend == "uv":
+            return ["uv", "pip", "install"]
+        return ["python", "-m", "pip", "install"]
+
+    def flush_installs(self) -> None:
+        """Install any packages deferred by ``--batch-install``.
+
+        This is called automatically before any other command runs and at the
+        end of the session, so it is only needed if something outside of Nox
+        has to see the packages earlier.
+        """
+        if not self._pending_installs:
+            return
+
+        args, self._pending_installs = self._pending_installs, []
+        assert self._pending_context is not None
+        cwd, pending_env = self._pending_context
+        # Undo any env changes made since the packages were requested; keys
+        # added since then fall back to the outer environment.
+        env = {**{k: os.environ.get(k) for k in self.env}, **pending_env}
+        with _chdir(cwd):
+            self._run(
+                *self._install_cmd(),
+                *args,
+                env=env,
+                include_outer_env=True,
+                external="error",
+                silent=True,
+                success_codes=None,
+                log=True,
+                stdout=None,
+                stderr=subprocess.STDOUT,
+                interrupt_timeout=DEFAULT_INTERRUPT_TIMEOUT,
+                terminate_timeout=DEFAULT_TERMINATE_TIMEOUT,
+            )
+
     def notify(
         self,
         target: str | SessionRunner,
@@ -940,7 +1106,7 @@ class SessionRunner:
     def __repr__(self) -> str:
         return f"<SessionRunner {self.name}: {self.signatures!r} {self.multi}>"
 
-    @property
+    @functools.cached_property
     def description(self) -> str | None:
         doc = self.func.__doc__
         if doc:
@@ -951,7 +1117,7 @@ class SessionRunner:
         sigs = ", ".join(self.signatures)
         return f"Session(name={self.name}, signatures={sigs})"
 
-    @property
+    @functools.cached_property
     def friendly_name(self) -> str:
         return self.signatures[0] if self.signatures else self.name
 
@@ -961,8 +1127,49 @@ class SessionRunner:
 
     @property
     def envdir(self) -> str:
+        if self.func.venv_key is not None:
+            # Sessions that declare the same interpreter, backend, backend
+            # parameters and requirements share a single environment, named
+            # after a hash of all of them.
+            key = repr(
+                (
+                    self.func.python,
+                    self._venv_backend(),
+                    list(self.func.venv_params or ()),
+                    sorted(self.func.venv_key),
+                )
+            )
+            name = _short_hash(key.encode("utf-8"), digest_size=8)
+            return _normalize_path(self.global_config.envdir, f"shared-{name}")
         return _normalize_path(self.global_config.envdir, self.friendly_name)
 
+    @functools.cached_property
+    def cached_result_path(self) -> str:
+        """Where a successful result of this session is recorded when
+        ``--cache-results`` is used.
+
+        The file is named after a hash of the session function's code, the
+        session's signatures and parameters, the positional arguments, and the
+        environment it runs in (Python, backend, ``venv_params`` and
+        ``venv_key``), so changing any of them causes the session to run again.
+        """
+        code = getattr(inspect.unwrap(self.func), "__code__", None)
+        key = repr(
+            (
+                self.signatures,
+                getattr(self.func, "call_spec", {}),
+                self.posargs,
+                getattr(self.func, "python", None),
+                self._venv_backend(),
+                getattr(self.func, "venv_params", None),
+                getattr(self.func, "venv_key", None),
+            )
+        ).encode("utf-8")
+        if code is not None:
+            key += marshal.dumps(code)
+        name = _short_hash(key, digest_size=16)
+        return os.path.join(self.global_config.envdir, ".cache", "results", name)
+
     def get_direct_dependencies(
         self, sessions_by_id: Mapping[str, SessionRunner] | None = None
     ) -> Iterator[SessionRunner]:
@@ -1002,14 +1209,17 @@ class SessionRunner:
             raise KeyError(msg) from exc
 
     def _create_venv(self) -> None:
-        reuse_existing = self.reuse_existing_venv()
+        # --no-venv overrides every backend choice, so there is nothing to
+        # select or create; run directly in Nox's own environment.
+        if self.global_config.force_venv_backend == "none":
+            self.venv = PassthroughEnv()
+            return
 
-        backends = (
-            self.global_config.force_venv_backend
-            or self.func.venv_backend
-            or self.global_config.default_venv_backend
-            or "virtualenv"
-        ).split("|")
+        reuse_existing = self.reuse_existing_venv() or (
+            self.func.venv_key is not None and self.global_config.reuse_venv != "never"
+        )
+
+        backends = self._venv_backend().split("|")
 
         self.venv = get_virtualenv(
             *backends,
@@ -1019,7 +1229,54 @@ class SessionRunner:
             venv_params=self.func.venv_params,
         )
 
+        location = getattr(self.venv, "location", None)
+        if location is None:
+            self.venv.create()
+            return
+
+        # Another session in this run already made sure this environment
+        # exists, so reusing it doesn't need to check it again.
+        key = (location, self.venv.venv_backend, self.func.python)
+        if reuse_existing and key in _ENSURED_VENVS:
+            self.venv._reused = True
+            return
+
         self.venv.create()
+        _ENSURED_VENVS.add(key)
+
+    def _venv_backend(self) -> str:
+        """The requested backend, possibly a ``|``-separated list of fallbacks."""
+        return (
+            self.global_config.force_venv_backend
+            or self.func.venv_backend
+            or self.global_config.default_venv_backend
+            or "virtualenv"
+        )
+
+    def _load_cached_status(self) -> Status | None:
+        """The status recorded by ``--cache-results``, if it is a readable
+        success."""
+        try:
+            with open(self.cached_result_path, encoding="utf-8") as f:
+                status = Status(json.load(f)["result_code"])
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return status if status == Status.SUCCESS else None
+
+    def _store_cached_result(self, result: Result) -> None:
+        """Record a successful result for ``--cache-results``.
+
+        Failing to do so only costs a rerun next time, so it is logged rather
+        than failing the session.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.cached_result_path), exist_ok=True)
+            with open(self.cached_result_path, "w", encoding="utf-8") as f:
+                json.dump(result.serialize(), f, default=str)
+        except OSError as exc:
+            logger.warning(
+                "Could not cache the result of session %s: %s", self.friendly_name, exc
+            )
 
     def reuse_existing_venv(self) -> bool:
         """
@@ -1073,7 +1330,7 @@ class SessionRunner:
         )
 
     def execute(self) -> Result:
-        logger.warning(f"Running session {self.friendly_name}")
+        logger.warning("Running session %s", self.friendly_name)
 
         for dependency in self.get_direct_dependencies():
             if not dependency.result:
@@ -1087,14 +1344,30 @@ class SessionRunner:
                 )
                 return self.result
 
+        # Runs that skip the session's commands or installs don't tell us
+        # whether it would pass, so they neither use nor record results.
+        cache_results = (
+            self.global_config.cache_results
+            and not self.global_config.install_only
+            and not self.global_config.no_install
+        )
+        status = self._load_cached_status() if cache_results else None
+        if status is not None:
+            logger.info("Reusing the cached result of session %s", self.friendly_name)
+            self.result = Result(self, status, reason="cached")
+            return self.result
+
         try:
-            cwd = os.path.realpath(os.path.dirname(self.global_config.noxfile))
+            cwd = self.global_config.noxfile_dir or os.path.realpath(
+                os.path.dirname(self.global_config.noxfile)
+            )
 
             with _chdir(cwd):
                 self._create_venv()
                 session = Session(self)
                 session.env["NOX_CURRENT_SESSION"] = session.name
                 self.func(session)
+                session.flush_installs()
 
             # Nothing went wrong; return a success.
             self.result = Result(self, Status.SUCCESS)
@@ -1118,13 +1391,16 @@ class SessionRunner:
             self.result = Result(self, Status.FAILED)
 
         except KeyboardInterrupt:
-            logger.error(f"Session {self.friendly_name} interrupted.")
+            logger.error("Session %s interrupted.", self.friendly_name)
             raise
 
         except Exception as exc:
-            logger.exception(f"Session {self.friendly_name} raised exception {exc!r}")
+            logger.exception("Session %s raised exception %r", self.friendly_name, exc)
             self.result = Result(self, Status.FAILED)
 
+        if cache_results and self.result.status == Status.SUCCESS:
+            self._store_cached_result(self.result)
+
         return self.result
 
 
@@ -1147,7 +1423,7 @@ class Result:
         self.reason = reason
 
     def __bool__(self) -> bool:
-        return self.status.value > 0
+        return self.status > 0
 
     @property
     def imperfect(self) -> str:
@@ -1159,7 +1435,7 @@ class Result:
         if self.status == Status.SUCCESS:
             return "was successful"
 
-        status = self.status.name.lower()
+        status = _STATUS_NAME_LOWER[self.status]
         if self.reason:
             return f"{status}: {self.reason}"
 
@@ -1171,13 +1447,7 @@ class Result:
         Args:
             message (str): The message to be logged.
         """
-        log_function = logger.info
-        if self.status == Status.SUCCESS:
-            log_function = logger.success
-        if self.status == Status.SKIPPED:
-            log_function = logger.warning
-        if self.status.value <= 0:
-            log_function = logger.error
+        log_function = getattr(logger, _STATUS_LOG.get(self.status, "info"))
         log_function(message)
 
     def serialize(self) -> dict[str, Any]:
@@ -1189,7 +1459,7 @@ class Result:
         return {
             "args": getattr(self.session.func, "call_spec", {}),
             "name": self.session.name,
-            "result": self.status.name.lower(),
+            "result": _STATUS_NAME_LOWER[self.status],
             "result_code": self.status.value,
             "signatures": self.session.signatures,
         }
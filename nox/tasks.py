@@ -29,7 +29,7 @@ from nox._resolver import CycleError
 from nox._version import InvalidVersionSpecifier, VersionCheckFailed, check_nox_version
 from nox.logger import logger
 from nox.manifest import WARN_PYTHONS_IGNORED, Manifest
-from nox.sessions import Result
+from nox.sessions import _STATUS_NAME_LOWER, Result
 
 if TYPE_CHECKING:
     import types
@@ -90,7 +90,8 @@ def load_nox_module(global_config: Namespace) -> types.ModuleType | int:
     .. note::
 
         This task has two side effects; it makes ``global_config.noxfile``
-        an absolute path, and changes the working directory of the process.
+        an absolute path (storing its directory in ``global_config.noxfile_dir``),
+        and changes the working directory of the process.
 
     Args:
         global_config (.nox.main.GlobalConfig): The global config.
@@ -110,6 +111,7 @@ def load_nox_module(global_config: Namespace) -> types.ModuleType | int:
     global_config.noxfile = os.path.join(
         noxfile_parent_dir, os.path.basename(global_config_noxfile)
     )
+    global_config.noxfile_dir = noxfile_parent_dir
 
     try:
         # Check ``nox.needs_version`` by parsing the AST.
@@ -270,28 +272,20 @@ def _produce_listing(manifest: Manifest, global_config: Namespace) -> None:
     selected_color = parse_colors("cyan") if global_config.color else ""
     skipped_color = parse_colors("white") if global_config.color else ""
 
-    for session, selected in manifest.list_all_sessions():
-        output = "{marker} {color}{session}{reset}"
-
-        if selected:
-            marker = "*"
-            color = selected_color
-        else:
-            marker = "-"
-            color = skipped_color
+    selected_prefix = f"* {selected_color}"
+    skipped_prefix = f"- {skipped_color}"
 
+    # Build the whole listing first and print it in one go.
+    lines = []
+    for session, selected in manifest.list_all_sessions():
+        prefix = selected_prefix if selected else skipped_prefix
+        line = f"{prefix}{session.friendly_name}{reset}"
         if session.description is not None:
-            output += " -> {description}"
-
-        print(
-            output.format(
-                color=color,
-                reset=reset,
-                session=session.friendly_name,
-                description=session.description,
-                marker=marker,
-            )
-        )
+            line += f" -> {session.description}"
+        lines.append(line)
+
+    if lines:
+        print("\n".join(lines))
 
     print(
         f"\nsessions marked with {selected_color}*{reset} are selected, sessions marked"
@@ -410,7 +404,7 @@ def print_summary(
     logger.warning("Ran multiple sessions:")
     for result in results:
         name = result.session.friendly_name
-        status = result.status.name.lower()
+        status = _STATUS_NAME_LOWER[result.status]
         result.log(f"* {name}: {status}")
 
     # Return the results that were sent to this function.
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
@@ -42,10 +43,17 @@ def __dir__() -> list[str]:
 
 DATA = files("nox")
 
-_TEMPLATE = jinja2.Template(
-    DATA.joinpath("tox4_to_nox.jinja2").read_text(encoding="utf-8"),
-    extensions=["jinja2.ext.do"],
-)
+_PY_ENV_RE = re.compile(r"py\d+")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template() -> jinja2.Template:
+    """Load and compile the Noxfile template the first time it's needed."""
+    template: jinja2.Template = jinja2.Template(
+        DATA.joinpath("tox4_to_nox.jinja2").read_text(encoding="utf-8"),
+        extensions=["jinja2.ext.do"],
+    )
+    return template
 
 
 def wrapjoin(seq: Iterable[Any]) -> str:
@@ -77,6 +85,7 @@ def main() -> None:
     original_config = ConfigParser()
     original_config.read_string(output)
     config: dict[str, dict[str, Any]] = {}
+    cwd = Path.cwd()
 
     for name, section in original_config.items():
         if name == "DEFAULT":
@@ -109,25 +118,23 @@ def main() -> None:
         )
 
         for option in "skip_install", "use_develop":
-            if section.get(option):
-                if section[option] == "False":
-                    config[name][option] = False
-                else:
-                    config[name][option] = True
-
-        if os.path.isabs(section["base_python"]) or re.match(
-            r"py\d+", section["base_python"]
+            value = section.get(option)
+            if value:
+                config[name][option] = value != "False"
+
+        if os.path.isabs(section["base_python"]) or _PY_ENV_RE.match(
+            section["base_python"]
         ):
             impl = "python" if section["py_impl"] == "cpython" else section["py_impl"]
             config[name]["base_python"] = impl + section["py_dot_ver"]
 
         change_dir = Path(section.get("change_dir", ""))
-        rel_to_cwd = change_dir.relative_to(Path.cwd())
+        rel_to_cwd = change_dir.relative_to(cwd)
         if str(rel_to_cwd) == ".":
             config[name]["change_dir"] = None
         else:
             config[name]["change_dir"] = rel_to_cwd
 
-    output = _TEMPLATE.render(config=config, wrapjoin=wrapjoin, fixname=fixname)
+    output = _get_template().render(config=config, wrapjoin=wrapjoin, fixname=fixname)
 
     write_output_to_file(output, args.output)
@@ -24,6 +24,7 @@ import shutil
 import subprocess
 import sys
 import sysconfig
+from importlib import metadata
 from pathlib import Path
 from socket import gethostbyname
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -80,9 +81,25 @@ _BLACKLISTED_ENV_VARS = frozenset(
     ]
 )
 
+# Interpreter specs of the form "X", "X.Y" or "X.Y.Z", and the Windows-only
+# "X.Y-32" form understood by the py launcher.
+_PY_VERSION_RE = re.compile(r"^(?P<xy_ver>\d(\.\d+)?)(\.\d+)?$")
+_PY_WIN32_VERSION_RE = re.compile(r"^\d\.\d+-32?$")
+
+
+def _which(name: str) -> str | None:
+    """:func:`shutil.which`, cached for as long as ``PATH`` is unchanged."""
+    return _which_on_path(name, os.environ.get("PATH"))
+
+
+@functools.lru_cache(maxsize=None)
+def _which_on_path(name: str, path: str | None) -> str | None:  # noqa: ARG001
+    # ``path`` only keys the cache; shutil.which reads PATH itself.
+    return shutil.which(name)
+
 
 def find_uv() -> tuple[bool, str]:
-    uv_on_path = shutil.which("uv")
+    uv_on_path = _which("uv")
 
     # Look for uv in Nox's environment, to handle `pipx install nox[uv]`.
     with contextlib.suppress(ImportError, FileNotFoundError):
@@ -103,6 +120,12 @@ def find_uv() -> tuple[bool, str]:
 
 def uv_version() -> version.Version:
     """Returns uv's version defaulting to 0.0 if uv is not available"""
+    # A uv found through the uv package (i.e. not plain "uv" from PATH) has
+    # the same version as the package, so skip running the binary.
+    if UV != "uv":
+        with contextlib.suppress(metadata.PackageNotFoundError):
+            return version.Version(metadata.version("uv"))
+
     try:
         ret = subprocess.run(
             [UV, "version", "--output-format", "json"],
@@ -116,7 +139,8 @@ def uv_version() -> version.Version:
         return version.Version("0.0")
 
     if ret.returncode == 0 and ret.stdout:
-        return version.Version(json.loads(ret.stdout).get("version"))
+        with contextlib.suppress(ValueError, TypeError, version.InvalidVersion):
+            return version.Version(json.loads(ret.stdout).get("version"))
     logger.info("Failed to establish uv's version.")
     return version.Version("0.0")
 
@@ -131,9 +155,27 @@ def uv_install_python(python_version: str) -> bool:
 
 
 HAS_UV, UV = find_uv()
-# supported since uv 0.3 but 0.4.16 is the first version that doesn't cause
-# issues for nox with pypy/cpython confusion
-UV_PYTHON_SUPPORT = uv_version() >= version.Version("0.4.16")
+UV_PYTHON_SUPPORT: bool
+
+
+@functools.lru_cache(maxsize=None)
+def _uv_python_support() -> bool:
+    """Whether uv can be used to install Pythons.
+
+    Finding uv's version may mean running uv, so this is only worked out the
+    first time it's needed.
+    """
+    # supported since uv 0.3 but 0.4.16 is the first version that doesn't cause
+    # issues for nox with pypy/cpython confusion
+    return uv_version() >= version.Version("0.4.16")
+
+
+def __getattr__(name: str) -> bool:
+    # UV_PYTHON_SUPPORT used to be computed at import; keep it available.
+    if name == "UV_PYTHON_SUPPORT":
+        return _uv_python_support()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 class InterpreterNotFound(OSError):
@@ -203,9 +245,10 @@ class ProcessEnv(abc.ABC):
         the outer environment be excluded. The initial env can be empty.
         """
 
-        computed_env = {**self.env, **env}
         if include_outer_env:
-            computed_env = {**os.environ, **computed_env}
+            computed_env = {**os.environ, **self.env, **env}
+        else:
+            computed_env = {**self.env, **env}
         if self.bin_paths:
             computed_env["PATH"] = os.pathsep.join(
                 [*self.bin_paths, computed_env.get("PATH") or ""]
@@ -213,6 +256,22 @@ class ProcessEnv(abc.ABC):
         return computed_env
 
 
+_BASE_PREFIX_PROGRAM = (
+    "import sys; sys.stdout.write(getattr(sys, 'real_prefix', sys.base_prefix))"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _interpreter_base_prefix(interpreter: str) -> str:
+    """Return the base prefix of ``interpreter``, asking it once per run."""
+    output = nox.command.run(
+        [interpreter, "-c", _BASE_PREFIX_PROGRAM], silent=True, log=False
+    )
+    assert isinstance(output, str)
+    return output
+
+
+@functools.lru_cache(maxsize=None)
 def locate_via_py(version: str) -> str | None:
     """Find the Python executable using the Windows Launcher.
 
@@ -229,10 +288,10 @@ def locate_via_py(version: str) -> str | None:
 
     Returns:
         Optional[str]: The full executable path for the Python ``version``,
-        if it is found.
+        if it is found. The answer is cached per ``version``.
     """
     script = "import sys; print(sys.executable)"
-    py_exe = shutil.which("py")
+    py_exe = _which("py")
     if py_exe is not None:
         ret = subprocess.run(
             [py_exe, f"-{version}", "-c", script],
@@ -246,6 +305,7 @@ def locate_via_py(version: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def locate_using_path_and_version(version: str) -> str | None:
     """Check the PATH's python interpreter and return it if the version
     matches.
@@ -260,13 +320,13 @@ def locate_using_path_and_version(version: str) -> str | None:
 
     Returns:
         Optional[str]: The full executable path for the Python ``version``,
-        if it is found.
+        if it is found. The answer is cached per ``version``.
     """
     if not version:
         return None
 
     script = "import platform; print(platform.python_version())"
-    path_python = shutil.which("python")
+    path_python = _which("python")
     if path_python:
         prefix = f"{version}"
         ret = subprocess.run(
@@ -348,8 +408,8 @@ class CondaEnv(ProcessEnv):
 
     def _clean_location(self) -> bool:
         """Deletes existing conda environment"""
-        is_conda = os.path.isdir(os.path.join(self.location, "conda-meta"))
         if os.path.exists(self.location):
+            is_conda = os.path.isdir(os.path.join(self.location, "conda-meta"))
             if self.reuse_existing and is_conda:
                 return False
             if not is_conda:
@@ -364,13 +424,13 @@ class CondaEnv(ProcessEnv):
                     "--all",
                 ]
                 nox.command.run(cmd, silent=True, log=False)
-            # Make sure that location is clean
-            with contextlib.suppress(FileNotFoundError):
-                shutil.rmtree(self.location)
+                # Make sure that location is clean
+                with contextlib.suppress(FileNotFoundError):
+                    shutil.rmtree(self.location)
 
         return True
 
-    @property
+    @functools.cached_property
     def bin_paths(self) -> list[str]:
         """Returns the location of the conda env's bin folder."""
         # see https://github.com/conda/conda/blob/f60f0f1643af04ed9a51da3dd4fa242de81e32f4/conda/activate.py#L563-L572
@@ -419,6 +479,7 @@ class CondaEnv(ProcessEnv):
         return True
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_offline() -> bool:
         """Return `True` if we are sure that the user is not able to connect to https://repo.anaconda.com.
 
@@ -427,6 +488,8 @@ class CondaEnv(ProcessEnv):
         `urllib` or `requests`, we are basically not able to do much more than testing the DNS resolution.
 
         See details in this explanation: https://stackoverflow.com/a/62486343/7262247
+
+        The answer is worked out once per run, so installs don't each wait on DNS.
         """
         try:
             # DNS resolution to detect situation (1) or (2).
@@ -500,7 +563,8 @@ class VirtualEnv(ProcessEnv):
         """Read a pyvenv.cfg file into dict, returns None if missing."""
         path = os.path.join(self.location, "pyvenv.cfg")
         with contextlib.suppress(FileNotFoundError), open(path, encoding="utf-8") as fp:
-            parts = (x.partition("=") for x in fp if "=" in x)
+            lines = fp.read().splitlines()
+            parts = (x.partition("=") for x in lines if "=" in x)
             return {k.strip(): v.strip() for k, _, v in parts}
         return None
 
@@ -551,19 +615,14 @@ class VirtualEnv(ProcessEnv):
         config = self._read_pyvenv_cfg() or {}
         original = config.get("base-prefix", None)
 
-        program = (
-            "import sys; sys.stdout.write(getattr(sys, 'real_prefix', sys.base_prefix))"
-        )
-
         if original is None:
-            output = nox.command.run(
-                [self._resolved_interpreter, "-c", program], silent=True, log=False
-            )
-            assert isinstance(output, str)
-            original = output
+            original = _interpreter_base_prefix(self._resolved_interpreter)
 
         created = nox.command.run(
-            ["python", "-c", program], silent=True, log=False, paths=self.bin_paths
+            ["python", "-c", _BASE_PREFIX_PROGRAM],
+            silent=True,
+            log=False,
+            paths=self.bin_paths,
         )
 
         return (
@@ -598,18 +657,18 @@ class VirtualEnv(ProcessEnv):
 
         # If this is just a X, X.Y, or X.Y.Z string, extract just the X / X.Y
         # part and add Python to the front of it.
-        match = re.match(r"^(?P<xy_ver>\d(\.\d+)?)(\.\d+)?$", self.interpreter)
+        match = _PY_VERSION_RE.match(self.interpreter)
         if match:
             xy_version = match.group("xy_ver")
             cleaned_interpreter = f"python{xy_version}"
 
         # If the cleaned interpreter is on the PATH, go ahead and return it.
-        if shutil.which(cleaned_interpreter):
+        if _which(cleaned_interpreter):
             self._resolved = cleaned_interpreter
             return self._resolved
 
         if (
-            self.venv_backend == "uv" and HAS_UV and UV_PYTHON_SUPPORT
+            self.venv_backend == "uv" and HAS_UV and _uv_python_support()
         ):  # pragma: nocover
             uv_python_success = uv_install_python(cleaned_interpreter)
             if uv_python_success:
@@ -623,7 +682,7 @@ class VirtualEnv(ProcessEnv):
             raise self._resolved
 
         # Allow versions of the form ``X.Y-32`` for Windows.
-        match = re.match(r"^\d\.\d+-32?$", cleaned_interpreter)
+        match = _PY_WIN32_VERSION_RE.match(cleaned_interpreter)
         if match:
             # preserve the "-32" suffix, as the Python launcher expects
             # it.
@@ -644,7 +703,7 @@ class VirtualEnv(ProcessEnv):
         self._resolved = InterpreterNotFound(self.interpreter)
         raise self._resolved
 
-    @property
+    @functools.cached_property
     def bin_paths(self) -> list[str]:
         """Returns the location of the virtualenv's bin folder."""
         if _PLATFORM.startswith("win") and not _IS_MINGW:
@@ -707,9 +766,9 @@ ALL_VENVS: dict[str, Callable[..., ProcessEnv]] = {
 # value is True. If an environment is always available, it should not be in this
 # dict. "virtualenv" is not considered optional since it's a dependency of nox.
 OPTIONAL_VENVS = {
-    "conda": shutil.which("conda") is not None,
-    "mamba": shutil.which("mamba") is not None,
-    "micromamba": shutil.which("micromamba") is not None,
+    "conda": _which("conda") is not None,
+    "mamba": _which("mamba") is not None,
+    "micromamba": _which("micromamba") is not None,
     "uv": HAS_UV,
 }
 
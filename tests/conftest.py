@@ -20,6 +20,9 @@ from typing import Callable
 
 import pytest
 
+import nox.sessions
+import nox.virtualenv
+
 
 @pytest.fixture(autouse=True)
 def reset_color_envvars(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -28,6 +31,23 @@ def reset_color_envvars(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("NO_COLOR", raising=False)
 
 
+@pytest.fixture(autouse=True)
+def reset_ensured_venvs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Forget environments created by other tests"""
+    monkeypatch.setattr(nox.sessions, "_ENSURED_VENVS", set())
+
+
+@pytest.fixture(autouse=True)
+def reset_interpreter_caches() -> None:
+    """Drop interpreter lookups cached by other tests, which often mock them"""
+    nox.virtualenv._which_on_path.cache_clear()
+    nox.virtualenv.locate_via_py.cache_clear()
+    nox.virtualenv.locate_using_path_and_version.cache_clear()
+    nox.virtualenv._interpreter_base_prefix.cache_clear()
+    nox.virtualenv._uv_python_support.cache_clear()
+    nox.virtualenv.CondaEnv.is_offline.cache_clear()
+
+
 RESOURCES = Path(__file__).parent.joinpath("resources")
 
 
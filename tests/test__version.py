@@ -96,6 +96,7 @@ def test_get_nox_version() -> None:
             ),
             None,
         ),
+        ("import nox\ndef not_parsed(:\n", None),
     ],
 )
 def test_parse_needs_version(text: str, expected: str | None) -> None:
@@ -90,6 +90,14 @@ def test_session_decorator_py_alias_error() -> None:
             pass
 
 
+def test_session_decorator_venv_key_str_error() -> None:
+    with pytest.raises(TypeError, match="venv_key"):
+
+        @registry.session_decorator(venv_key="pytest")  # type: ignore[call-overload]
+        def unit_tests(session: nox.Session) -> None:
+            pass
+
+
 def test_session_decorator_reuse() -> None:
     @registry.session_decorator(reuse_venv=True)
     def unit_tests(session: nox.Session) -> None:
@@ -40,6 +40,9 @@ import nox.virtualenv
 from nox import _options
 from nox.logger import logger
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
 HAS_CONDA = shutil.which("conda") is not None
 has_conda = pytest.mark.skipif(not HAS_CONDA, reason="Missing conda command.")
 
@@ -90,6 +93,8 @@ def test__normalize_path() -> None:
     assert normalize(envdir, 'tests(interpreter="python2.7", django="1.10")') == (
         os.path.join("envdir", "tests-interpreter-python2-7-django-1-10")
     )
+    assert normalize(envdir, "tést(ünïcode)") == os.path.join("envdir", "test-unicode")
+    assert normalize(envdir, "日本語-only") == os.path.join("envdir", "only")
 
 
 def test__normalize_path_hash() -> None:
@@ -122,7 +127,7 @@ class TestSession:
     def make_session_and_runner(
         self,
     ) -> tuple[nox.sessions.Session, nox.sessions.SessionRunner]:
-        func = mock.Mock(spec=["python"], python="3.7")
+        func = mock.Mock(spec=["python", "venv_key"], python="3.7", venv_key=None)
         runner = nox.sessions.SessionRunner(
             name="test",
             signatures=["test"],
@@ -177,6 +182,14 @@ class TestSession:
                 ".cache"
             )
 
+    def test_bin_cached(self) -> None:
+        session, runner = self.make_session_and_runner()
+
+        assert session.bin == "/no/bin/for/you"
+        assert runner.venv
+        runner.venv.bin_paths = None  # type: ignore[misc]
+        assert session.bin == "/no/bin/for/you"
+
     def test_no_bin_paths(self) -> None:
         session, runner = self.make_session_and_runner()
 
@@ -810,6 +823,108 @@ class TestSession:
                 **_run_with_defaults(silent=False, external="error"),
             )
 
+    def test_install_batched(self) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+
+        with mock.patch("nox.command.run", autospec=True) as run:
+            session.install("requests")
+            session.install("urllib3")
+            run.assert_not_called()
+
+            session.install("-e", ".")
+            assert [c.args[0] for c in run.call_args_list] == [
+                ("python", "-m", "pip", "install", "requests", "urllib3"),
+                ("python", "-m", "pip", "install", "-e", "."),
+            ]
+
+    def test_install_batched_flushed_before_run(self) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+
+        with mock.patch("nox.command.run", autospec=True) as run:
+            session.install("requests", "urllib3")
+            run.assert_not_called()
+
+            session.run("pytest")
+            assert [c.args[0] for c in run.call_args_list] == [
+                ("python", "-m", "pip", "install", "requests", "urllib3"),
+                ("pytest",),
+            ]
+
+    def test_install_batched_skips_paths(self) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+
+        with mock.patch("nox.command.run", autospec=True) as run:
+            session.install(".")
+            session.install("./pkg")
+            assert [c.args[0] for c in run.call_args_list] == [
+                ("python", "-m", "pip", "install", "."),
+                ("python", "-m", "pip", "install", "./pkg"),
+            ]
+
+    def test_install_batched_repeated_project(self) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+
+        with mock.patch("nox.command.run", autospec=True) as run:
+            session.install("pkg==1.0", "requests")
+            session.install("urllib3")
+            session.install("PKG==2.0")
+            session.install("not a requirement")
+            assert [c.args[0] for c in run.call_args_list] == [
+                ("python", "-m", "pip", "install", "pkg==1.0", "requests", "urllib3"),
+                ("python", "-m", "pip", "install", "PKG==2.0"),
+                ("python", "-m", "pip", "install", "not a requirement"),
+            ]
+
+    def test_install_batched_keeps_cwd_and_env(self, tmp_path: Path) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+        cwds = []
+
+        with mock.patch(
+            "nox.command.run",
+            autospec=True,
+            side_effect=lambda *_, **__: cwds.append(os.getcwd()),
+        ) as run:
+            session.install("requests")
+            session.env["SIGIL"] = "123"
+            session.install("urllib3")
+            assert run.call_args_list[0].kwargs["env"].get("SIGIL") is None
+
+            cwd = os.getcwd()
+            with session.chdir(tmp_path):
+                session.install("pytest")
+            session.run("pytest")
+
+        assert [c.args[0] for c in run.call_args_list] == [
+            ("python", "-m", "pip", "install", "requests"),
+            ("python", "-m", "pip", "install", "urllib3"),
+            ("python", "-m", "pip", "install", "pytest"),
+            ("pytest",),
+        ]
+        assert run.call_args_list[1].kwargs["env"]["SIGIL"] == "123"
+        assert cwds == [cwd, cwd, str(tmp_path), cwd]
+
+    def test_install_batched_restores_outer_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        session, runner = self.make_session_and_runner()
+        runner.global_config.batch_install = True
+        monkeypatch.setenv("PIP_INDEX_URL", "https://corp/simple")
+
+        with mock.patch("nox.command.run", autospec=True) as run:
+            session.install("requests")
+            session.env["PIP_INDEX_URL"] = "https://example.com/simple"
+            session.run("pytest")
+
+        install_env = run.call_args_list[0].kwargs["env"]
+        assert install_env["PIP_INDEX_URL"] == "https://corp/simple"
+        run_env = run.call_args_list[1].kwargs["env"]
+        assert run_env["PIP_INDEX_URL"] == "https://example.com/simple"
+
     def test_install_no_venv_failure(self) -> None:
         runner = nox.sessions.SessionRunner(
             name="test",
@@ -1039,8 +1154,10 @@ class TestSessionRunner:
         func = mock.Mock()
         func.python = None
         func.venv_backend = None
+        func.venv_params = []
         func.reuse_venv = False
         func.requires = []
+        func.venv_key = None
         return nox.sessions.SessionRunner(
             name="test",
             signatures=["test(1, 2)"],
@@ -1109,6 +1226,16 @@ class TestSessionRunner:
 
         assert isinstance(runner.venv, nox.virtualenv.ProcessEnv)
 
+    def test__create_venv_no_venv(self) -> None:
+        runner = self.make_runner()
+        runner.global_config.force_venv_backend = "none"
+
+        with mock.patch("nox.sessions.get_virtualenv", autospec=True) as get_venv:
+            runner._create_venv()
+
+        get_venv.assert_not_called()
+        assert isinstance(runner.venv, nox.virtualenv.PassthroughEnv)
+
     @mock.patch("nox.virtualenv.VirtualEnv.create", autospec=True)
     def test__create_venv(self, create: mock.Mock) -> None:
         runner = self.make_runner()
@@ -1121,6 +1248,48 @@ class TestSessionRunner:
         assert runner.venv.interpreter is None
         assert runner.venv.reuse_existing is False
 
+    def test__create_venv_reused_in_same_run(self) -> None:
+        runner = self.make_runner()
+        runner.func.reuse_venv = True
+        other = self.make_runner()
+        other.func.reuse_venv = True
+
+        with mock.patch("nox.virtualenv.VirtualEnv.create", autospec=True) as create:
+            runner._create_venv()
+            other._create_venv()
+
+        create.assert_called_once_with(runner.venv)
+        assert other.venv._reused  # type: ignore[union-attr]
+
+        other.func.reuse_venv = False
+        with mock.patch("nox.virtualenv.VirtualEnv.create", autospec=True) as create:
+            other._create_venv()
+
+        create.assert_called_once_with(other.venv)
+
+    def test__create_venv_venv_key(self) -> None:
+        runner = self.make_runner()
+        runner.func.venv_key = ["pytest", "coverage"]
+        other = self.make_runner()
+        other.signatures = ["other"]
+        other.func.venv_key = ["coverage", "pytest"]
+
+        with mock.patch("nox.virtualenv.VirtualEnv.create", autospec=True):
+            runner._create_venv()
+
+        assert runner.venv.location == os.path.abspath(other.envdir)  # type: ignore[union-attr]
+        assert "test-1-2" not in runner.envdir
+        assert runner.venv.reuse_existing is True  # type: ignore[union-attr]
+
+        other.func.python = "3.12"
+        assert other.envdir != runner.envdir
+        other.func.python = None
+        other.func.venv_backend = "venv"
+        assert other.envdir != runner.envdir
+        other.func.venv_backend = None
+        other.func.venv_params = ["--system-site-packages"]
+        assert other.envdir != runner.envdir
+
     @pytest.mark.parametrize(
         ("create_method", "venv_backend", "expected_backend"),
         [
@@ -1260,6 +1429,145 @@ class TestSessionRunner:
         runner.func.assert_called_once_with(mock.ANY)  # type: ignore[attr-defined]
         assert "Running session test(1, 2)" in caplog.text
 
+    def test_execute_uses_noxfile_dir(self, tmp_path: Path) -> None:
+        runner = self.make_runner_with_mock_venv()
+        runner.global_config.noxfile_dir = str(tmp_path)
+        cwds = []
+
+        def func(session: nox.Session) -> None:  # noqa: ARG001
+            cwds.append(os.getcwd())
+
+        func.requires = []  # type: ignore[attr-defined]
+        runner.func = func  # type: ignore[assignment]
+
+        assert runner.execute()
+        assert cwds == [str(tmp_path)]
+
+    def make_runner_with_cache(self, tmp_path: Path) -> nox.sessions.SessionRunner:
+        runner = self.make_runner_with_mock_venv()
+        runner.global_config.envdir = str(tmp_path)
+        runner.global_config.cache_results = True
+        return runner
+
+    @staticmethod
+    def set_cached_func(
+        runner: nox.sessions.SessionRunner, func: Callable[[nox.Session], None]
+    ) -> None:
+        func.requires = []  # type: ignore[attr-defined]
+        func.venv_backend = None  # type: ignore[attr-defined]
+        runner.func = func  # type: ignore[assignment]
+
+    def test_execute_cache_results(self, tmp_path: Path) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+        calls = []
+
+        def func(session: nox.Session) -> None:
+            calls.append(session.name)
+
+        self.set_cached_func(runner, func)
+
+        assert runner.execute()
+        assert os.path.exists(runner.cached_result_path)
+
+        result = runner.execute()
+        assert result.status == nox.sessions.Status.SUCCESS
+        assert result.reason == "cached"
+        assert calls == ["test(1, 2)"]
+
+        other = self.make_runner_with_mock_venv()
+        other.global_config = runner.global_config
+        other.signatures = ["test(3, 4)"]
+        other.func = func  # type: ignore[assignment]
+        assert other.execute()
+        assert calls == ["test(1, 2)", "test(3, 4)"]
+
+        # Sessions queued by session.notify() can have their own posargs.
+        with_posargs = self.make_runner_with_cache(tmp_path)
+        with_posargs.posargs = ["fail"]
+        self.set_cached_func(with_posargs, func)
+        assert with_posargs.cached_result_path != runner.cached_result_path
+        assert with_posargs.execute().reason is None
+        assert calls == ["test(1, 2)", "test(3, 4)", "test(1, 2)"]
+
+    def test_execute_cache_results_unreadable(self, tmp_path: Path) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+        calls = []
+
+        def func(session: nox.Session) -> None:
+            calls.append(session.name)
+
+        self.set_cached_func(runner, func)
+
+        os.makedirs(os.path.dirname(runner.cached_result_path))
+        Path(runner.cached_result_path).write_text("{", encoding="utf-8")
+
+        result = runner.execute()
+        assert result.status == nox.sessions.Status.SUCCESS
+        assert result.reason is None
+        assert calls == ["test(1, 2)"]
+
+    def test_execute_cache_results_only_success(self, tmp_path: Path) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+        calls = []
+
+        def func(session: nox.Session) -> None:
+            calls.append(session.name)
+
+        self.set_cached_func(runner, func)
+
+        os.makedirs(os.path.dirname(runner.cached_result_path))
+        Path(runner.cached_result_path).write_text(
+            '{"result_code": 0}', encoding="utf-8"
+        )
+
+        result = runner.execute()
+        assert result.status == nox.sessions.Status.SUCCESS
+        assert result.reason is None
+        assert calls == ["test(1, 2)"]
+
+    @pytest.mark.parametrize("option", ["install_only", "no_install"])
+    def test_execute_cache_results_skipped_commands(
+        self, tmp_path: Path, option: str
+    ) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+        setattr(runner.global_config, option, True)
+
+        def func(session: nox.Session) -> None:
+            pass
+
+        self.set_cached_func(runner, func)
+
+        assert runner.execute()
+        assert not os.path.exists(runner.cached_result_path)
+
+    def test_execute_cache_results_unwritable(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+
+        def func(session: nox.Session) -> None:
+            pass
+
+        self.set_cached_func(runner, func)
+
+        # A file where the cache directory should be.
+        (tmp_path / ".cache").write_text("", encoding="utf-8")
+
+        result = runner.execute()
+        assert result.status == nox.sessions.Status.SUCCESS
+        assert "Could not cache the result of session test(1, 2)" in caplog.text
+
+    def test_execute_cache_results_failure_not_cached(self, tmp_path: Path) -> None:
+        runner = self.make_runner_with_cache(tmp_path)
+
+        def func(session: nox.Session) -> None:
+            session.error("meep")
+
+        self.set_cached_func(runner, func)
+
+        assert not runner.execute()
+        assert not os.path.exists(runner.cached_result_path)
+
     def test_execute_quit(self) -> None:
         runner = self.make_runner_with_mock_venv()
 
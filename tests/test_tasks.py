@@ -88,6 +88,7 @@ def test_load_nox_module() -> None:
     noxfile_module = tasks.load_nox_module(config)
     assert not isinstance(noxfile_module, int)
     assert noxfile_module.SIGIL == "123"
+    assert config.noxfile_dir == os.path.realpath(RESOURCES)
 
 
 def test_load_nox_module_expandvars() -> None:
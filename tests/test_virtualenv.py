@@ -268,6 +268,15 @@ def test_condaenv_(make_conda: Callable[..., tuple[CondaEnv, Path]]) -> None:
     assert not venv.is_offline()
 
 
+def test_condaenv_is_offline_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    gethostbyname = mock.Mock(return_value="104.16.131.3")
+    monkeypatch.setattr(nox.virtualenv, "gethostbyname", gethostbyname)
+
+    assert not nox.virtualenv.CondaEnv.is_offline()
+    assert not nox.virtualenv.CondaEnv.is_offline()
+    gethostbyname.assert_called_once_with("repo.anaconda.com")
+
+
 @has_conda
 def test_condaenv_detection(make_conda: Callable[..., tuple[CondaEnv, Path]]) -> None:
     venv, dir_ = make_conda()
@@ -708,6 +717,43 @@ def test_create_reuse_uv_environment(
     assert reused
 
 
+def test__which_cached_per_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    which = mock.Mock(return_value="/usr/bin/conda")
+    monkeypatch.setattr(shutil, "which", which)
+    monkeypatch.setenv("PATH", "/usr/bin")
+
+    assert nox.virtualenv._which("conda") == "/usr/bin/conda"
+    assert nox.virtualenv._which("conda") == "/usr/bin/conda"
+    which.assert_called_once_with("conda")
+
+    monkeypatch.setenv("PATH", "/opt/bin")
+    nox.virtualenv._which("conda")
+    assert which.call_count == 2
+
+
+def test__interpreter_base_prefix_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    run = mock.Mock(return_value="/usr")
+    monkeypatch.setattr(nox.command, "run", run)
+
+    assert nox.virtualenv._interpreter_base_prefix("python3.11") == "/usr"
+    assert nox.virtualenv._interpreter_base_prefix("python3.11") == "/usr"
+    run.assert_called_once()
+
+
+def test_locate_via_py_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(shutil, "which", lambda _: r"c:\windows\py.exe")
+    run = mock.Mock(
+        return_value=subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="c:\\python37\\python.exe\n"
+        )
+    )
+    monkeypatch.setattr(subprocess, "run", run)
+
+    assert nox.virtualenv.locate_via_py("3.7") == r"c:\python37\python.exe"
+    assert nox.virtualenv.locate_via_py("3.7") == r"c:\python37\python.exe"
+    run.assert_called_once()
+
+
 UV_IN_PIPX_VENV = "/home/user/.local/pipx/venvs/nox/bin/uv"
 
 
@@ -747,6 +793,7 @@ def test_find_uv(
         (0, '{"version": "0.2.3", "commit_info": null}', "0.2.3"),
         (1, None, "0.0"),
         (1, '{"version": "9.9.9", "commit_info": null}', "0.0"),
+        (0, "uv 0.2.3", "0.0"),
     ],
 )
 def test_uv_version(
@@ -766,6 +813,25 @@ def test_uv_version(
     assert nox.virtualenv.uv_version() == version.Version(expected_result)
 
 
+def test_uv_version_from_package(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(nox.virtualenv, "UV", UV_IN_PIPX_VENV)
+    monkeypatch.setattr(metadata, "version", lambda _: "0.4.20")
+    run = mock.Mock()
+    monkeypatch.setattr(subprocess, "run", run)
+
+    assert nox.virtualenv.uv_version() == version.Version("0.4.20")
+    run.assert_not_called()
+
+
+def test_uv_python_support_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    uv_version = mock.Mock(return_value=version.Version("0.4.16"))
+    monkeypatch.setattr(nox.virtualenv, "uv_version", uv_version)
+
+    assert nox.virtualenv._uv_python_support() is True
+    assert nox.virtualenv.UV_PYTHON_SUPPORT is True
+    uv_version.assert_called_once_with()
+
+
 def test_uv_version_no_uv(monkeypatch: pytest.MonkeyPatch) -> None:
     def mock_exception(*args: object, **kwargs: object) -> NoReturn:
         raise FileNotFoundError
@@ -1054,7 +1120,7 @@ def test__resolved_interpreter_windows_pyexe_fails(
 
 
 @mock.patch("nox.virtualenv._PLATFORM", new="win32")
-@mock.patch("nox.virtualenv.UV_PYTHON_SUPPORT", new=False)
+@mock.patch("nox.virtualenv._uv_python_support", new=lambda: False)  # noqa: PT008
 def test__resolved_interpreter_windows_path_and_version(
     make_one: Callable[..., tuple[VirtualEnv, Path]],
     patch_sysfind: Callable[..., None],
@@ -1083,7 +1149,7 @@ def test__resolved_interpreter_windows_path_and_version(
 @pytest.mark.parametrize("sysfind_result", [r"c:\python37-x64\python.exe", None])
 @pytest.mark.parametrize("sysexec_result", ["3.7.3\\n", RAISE_ERROR])
 @mock.patch("nox.virtualenv._PLATFORM", new="win32")
-@mock.patch("nox.virtualenv.UV_PYTHON_SUPPORT", new=False)
+@mock.patch("nox.virtualenv._uv_python_support", new=lambda: False)  # noqa: PT008
 def test__resolved_interpreter_windows_path_and_version_fails(
     input_: str,
     sysfind_result: None | str,